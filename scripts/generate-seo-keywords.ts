@@ -14,6 +14,8 @@ import yaml from 'js-yaml';
 const ROOT = path.resolve(import.meta.dirname, '..');
 const SITE_CONFIG_PATH = path.join(ROOT, 'config', 'site.yml');
 const RESEARCH_CONFIG_PATH = path.join(ROOT, 'config', 'research.yml');
+// Written by sync-scholar.py when outputFormat is json
+const PUBLICATIONS_DATA_PATH = path.join(ROOT, 'src', 'data', 'publications.json');
 
 const CONTENT_DIRS = [
   'src/content/publications',
@@ -226,6 +228,14 @@ function addWeighted(counts: Map<string, number>, terms: string[], weight: numbe
   }
 }
 
+function addPublication(counts: Map<string, number>, pub: Record<string, unknown>): void {
+  // Title, venue: weight 3
+  if (pub.title) addWeighted(counts, extractTerms(pub.title as string), 3);
+  if (pub.venue) addWeighted(counts, extractTerms(pub.venue as string), 2);
+  // Abstract: weight 1
+  if (pub.abstract) addWeighted(counts, extractTerms(pub.abstract as string), 1);
+}
+
 function main() {
   const counts = new Map<string, number>();
 
@@ -262,11 +272,7 @@ function main() {
 
       switch (dirName) {
         case 'publications': {
-          // Title, venue: weight 3
-          if (fm.title) addWeighted(counts, extractTerms(fm.title as string), 3);
-          if (fm.venue) addWeighted(counts, extractTerms(fm.venue as string), 2);
-          // Abstract: weight 1
-          if (fm.abstract) addWeighted(counts, extractTerms(fm.abstract as string), 1);
+          addPublication(counts, fm);
           break;
         }
         case 'projects': {
@@ -306,6 +312,17 @@ function main() {
     }
   }
 
+  // 4. Publications kept in the data file (skipping any that also have a .md file)
+  if (fs.existsSync(PUBLICATIONS_DATA_PATH)) {
+    const mdIds = new Set(
+      getMarkdownFiles('src/content/publications').map((f) => path.basename(f).replace(/\.mdx?$/, '')),
+    );
+    const pubs = JSON.parse(fs.readFileSync(PUBLICATIONS_DATA_PATH, 'utf-8')) as Array<Record<string, unknown>>;
+    for (const pub of pubs) {
+      if (!mdIds.has(pub.id as string)) addPublication(counts, pub);
+    }
+  }
+
   // Rank and pick top 30
   const sorted = [...counts.entries()].filter(([term]) => term.length > 2).sort((a, b) => b[1] - a[1]);
 
@@ -3,10 +3,30 @@
 Render CV PDF from config/cv.yml using RenderCV.
 
 Reads the CMS-friendly cv.yml, converts to RenderCV's expected format,
-runs rendercv to generate a PDF, copies the output to public/cv.pdf,
-and writes metadata to src/data/cv.json.
+runs rendercv to generate a PDF, publishes it under a content-hashed
+name (public/cv.<hash>.pdf) with public/cv.pdf kept as a stable alias,
+and writes metadata pointing at the hashed path to src/data/cv.json.
+
+Hashed PDFs never change once written, so public/_headers marks them
+immutable while the stable aliases are always revalidated. PDF timestamps
+are pinned to the CV source's last commit (SOURCE_DATE_EPOCH), so Typst
+renders of unchanged input keep the same hash. LaTeX renders still include
+RenderCV's "Last updated" month, so their hash changes once a month unless
+design.disable_last_updated_date is set. The previously published hash is
+kept for one more generation so cached links don't break on deploy.
+
+With --tex-cache, RenderCV compiles through the system TeX install using a
+precompiled format of each document's preamble and a persistent latexmk
+work directory, so repeat renders skip class/package/font loading and reuse
+aux state. Formats are keyed on the preamble (theme + design) and TeX version.
+
+Setting `engine: typst` in config/cv.yml (or a cv/<person>.yml) renders that
+CV with a built-in Typst layout instead of RenderCV's LaTeX pipeline, using
+the same build_rendercv_input() data and no TeX install.
 """
 
+import argparse
+import hashlib
 import json
 import os
 import re
@@ -14,6 +34,7 @@ import shutil
 import subprocess
 import sys
 import tempfile
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -22,12 +43,18 @@ import yaml
 ROOT = Path(__file__).resolve().parent.parent
 CONFIG_PATH = ROOT / "config" / "cv.yml"
 UPLOAD_PATH = ROOT / "config" / "cv-upload.yml"
-OUTPUT_PDF = ROOT / "public" / "cv.pdf"
+PUBLIC_DIR = ROOT / "public"
+OUTPUT_STEM = "cv"
+HEADERS_PATH = PUBLIC_DIR / "_headers"
 METADATA_PATH = ROOT / "src" / "data" / "cv.json"
 PERSON_CV_DIR = ROOT / "cv"
 PERSON_OUTPUT_DIR = ROOT / "public" / "cv"
 PERSON_META_PATH = ROOT / "src" / "data" / "cv-people.json"
 MAX_PDF_SIZE = 10 * 1024 * 1024  # 10 MB limit
+HASH_LENGTH = 12  # hex chars of sha256 kept in published filenames
+TEX_CACHE_DIR = ROOT / ".cache" / "render-cv"
+ENGINES = ("latex", "typst")
+DEFAULT_ENGINE = "latex"
 
 
 def load_upload() -> tuple[str, dict] | None:
@@ -58,6 +85,14 @@ def load_config() -> dict:
         return yaml.safe_load(f)
 
 
+def resolve_engine(config: dict | None, default: str = DEFAULT_ENGINE) -> str:
+    """Return the rendering engine selected by a config's top-level `engine` key."""
+    engine = str((config or {}).get("engine") or default).lower()
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown CV engine '{engine}' (expected one of: {', '.join(ENGINES)})")
+    return engine
+
+
 def camel_to_snake(name: str) -> str:
     """Convert camelCase to snake_case."""
     s1 = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
@@ -95,6 +130,12 @@ def sync_upload_to_structured(uploaded: dict) -> None:
     """
     camel_data = convert_keys_to_camel(uploaded)
 
+    # Keep site-level render settings that RenderCV uploads don't carry
+    if CONFIG_PATH.exists() and "engine" not in camel_data:
+        engine = (load_config() or {}).get("engine")
+        if engine:
+            camel_data["engine"] = engine
+
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
     with open(CONFIG_PATH, "w") as f:
         yaml.dump(camel_data, f, default_flow_style=False, allow_unicode=True)
@@ -236,12 +277,395 @@ def find_output_pdf(output_dir: Path) -> Path | None:
     return None
 
 
-def render_cv(rendercv_input: dict | str) -> Path:
-    """Run RenderCV and return path to the generated PDF.
+def tex_version() -> str:
+    """Return the pdfTeX version banner (part of the format cache key)."""
+    result = subprocess.run(["pdftex", "--version"], capture_output=True, text=True)
+    return result.stdout.splitlines()[0] if result.stdout else ""
+
+
+def latex_wrapper(cache_dir: Path) -> Path:
+    """Write an executable that RenderCV can use as its local LaTeX command.
+
+    RenderCV first checks it with `<wrapper> --version`, then invokes it as
+    `<wrapper> <file.tex>` and expects <file.pdf> next to the input; the
+    wrapper answers the version check with pdfTeX's and delegates
+    compilation to compile_latex().
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    wrapper = cache_dir / "latex-compile"
+    wrapper.write_text(
+        "#!/bin/sh\n"
+        'case "$1" in --version) exec pdftex --version;; esac\n'
+        f'exec "{sys.executable}" "{Path(__file__).resolve()}" --tex-cache "{cache_dir}" --latex-compile="$1"\n',
+        encoding="utf-8",
+    )
+    wrapper.chmod(0o755)
+    return wrapper
+
+
+def ensure_format(preamble: str, cache_dir: Path, env: dict) -> Path | None:
+    """Dump (or reuse) a pdfLaTeX format containing the given preamble.
+
+    Returns the .fmt path, or None if dumping failed.
+    """
+    key = hashlib.sha256(f"{tex_version()}\n{preamble}".encode("utf-8")).hexdigest()[:HASH_LENGTH]
+    fmt_dir = cache_dir / "formats"
+    fmt_path = fmt_dir / f"{key}.fmt"
+    if fmt_path.exists():
+        print(f"Reusing precompiled preamble {fmt_path.name}")
+        return fmt_path
+
+    fmt_dir.mkdir(parents=True, exist_ok=True)
+    source = fmt_dir / f"{key}.tex"
+    source.write_text(preamble + "\n\\dump\n", encoding="utf-8")
+    result = subprocess.run(
+        ["pdftex", "-ini", "-interaction=nonstopmode", f"-jobname={key}",
+         f"-output-directory={fmt_dir}", "&pdflatex", str(source)],
+        capture_output=True,
+        text=True,
+        cwd=fmt_dir,
+        env=env,
+        timeout=120,
+    )
+    if result.returncode != 0 or not fmt_path.exists():
+        print(f"WARNING: Could not precompile preamble, compiling without it:\n{result.stdout[-2000:]}")
+        return None
+
+    print(f"Precompiled preamble to {fmt_path.name}")
+    return fmt_path
+
+
+def compile_latex(tex_path: Path, cache_dir: Path) -> int:
+    """Compile tex_path with a cached preamble format in a persistent work dir.
+
+    The PDF is copied next to tex_path, where RenderCV looks for it.
+    """
+    text = tex_path.read_text(encoding="utf-8")
+    work_dir = cache_dir / "work" / tex_path.stem
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    # Resolve photos and other assets RenderCV placed beside the .tex file
+    env = {**os.environ, "TEXINPUTS": f"{tex_path.parent}{os.pathsep}"}
+
+    marker = "\\begin{document}"
+    fmt_path = None
+    body = text
+    if marker in text:
+        preamble, rest = text.split(marker, 1)
+        fmt_path = ensure_format(preamble, cache_dir, env)
+        if fmt_path is not None:
+            body = marker + rest
+
+    work_tex = work_dir / tex_path.name
+    work_pdf = work_tex.with_suffix(".pdf")
+
+    def run_latexmk(source: str, fmt: Path | None) -> int:
+        # Only touch the work copy when it changed so latexmk can skip the build
+        if not work_tex.exists() or work_tex.read_text(encoding="utf-8") != source:
+            work_tex.write_text(source, encoding="utf-8")
+        pdflatex = "pdflatex -interaction=nonstopmode"
+        if fmt is not None:
+            pdflatex += f' -fmt="{fmt}"'
+        result = subprocess.run(
+            ["latexmk", "-pdf", f"-pdflatex={pdflatex} %O %S", f"-outdir={work_dir}", work_tex.name],
+            cwd=work_dir,
+            env=env,
+            timeout=120,
+        )
+        if result.returncode != 0 or not work_pdf.exists():
+            return result.returncode or 1
+        return 0
+
+    returncode = run_latexmk(body, fmt_path)
+    if returncode != 0 and fmt_path is not None:
+        # A stale or broken format must not fail the render; rebuild next time
+        print(f"WARNING: Compiling with cached format {fmt_path.name} failed; retrying without it")
+        fmt_path.unlink(missing_ok=True)
+        returncode = run_latexmk(text, None)
+    if returncode != 0:
+        return returncode
+    shutil.copy2(work_pdf, tex_path.with_suffix(".pdf"))
+    return 0
+
+
+TYPST_PAGE_SIZES = {"letterpaper": "us-letter", "a4paper": "a4", "us-letter": "us-letter", "a4": "a4"}
+TYPST_DEFAULT_COLOR = "rgb(0, 79, 144)"
+SOCIAL_URLS = {
+    "linkedin": "https://linkedin.com/in/{}",
+    "github": "https://github.com/{}",
+    "gitlab": "https://gitlab.com/{}",
+    "twitter": "https://x.com/{}",
+    "x": "https://x.com/{}",
+    "orcid": "https://orcid.org/{}",
+    "google scholar": "https://scholar.google.com/citations?user={}",
+    "researchgate": "https://researchgate.net/profile/{}",
+    "instagram": "https://instagram.com/{}",
+    "youtube": "https://youtube.com/@{}",
+}
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "June", "July", "Aug", "Sept", "Oct", "Nov", "Dec"]
+
+TYPST_PREAMBLE = """\
+#let primary = {color}
+#set document(title: {title}, author: {author}, date: {date})
+#set page(paper: "{paper}", margin: (x: 2cm, y: 2cm))
+#set text(font: "New Computer Modern", size: 10pt)
+#set par(justify: true, leading: 0.55em)
+#show link: set text(fill: primary)
+
+#let section(title) = {{
+  v(0.9em)
+  text(size: 1.3em, weight: "bold", fill: primary, title)
+  v(-0.75em)
+  line(length: 100%, stroke: 0.5pt + primary)
+  v(0.2em)
+}}
+
+#let entry(main, side, sub: none, subside: none, highlights: ()) = {{
+  block(breakable: false, above: 0.9em, below: 0.9em, {{
+    grid(
+      columns: (1fr, auto),
+      column-gutter: 1em,
+      row-gutter: 0.5em,
+      main, align(right, side),
+      ..if sub != none or subside != none {{ (sub, align(right, subside)) }},
+    )
+    if highlights.len() > 0 {{
+      v(-0.3em)
+      list(indent: 0.6em, ..highlights)
+    }}
+  }})
+}}
+"""
+
+
+def typst_escape(text) -> str:
+    """Escape a plain string for use inside Typst markup."""
+    return re.sub(r"([\\#*_`<>@$\[\]~/=+\-])", r"\\\1", str(text))
+
+
+def typst_string(text) -> str:
+    """Quote a value as a Typst string literal."""
+    return '"' + str(text).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def markdown_to_typst(text) -> str:
+    """Convert the Markdown subset RenderCV accepts (bold, italic, links) to Typst.
+
+    Each embedded expression ends with `;` so following text such as `(2020)`
+    or `.Then` isn't parsed as a call or field access.
+    """
+    out = []
+    pos = 0
+    pattern = re.compile(r"\*\*(.+?)\*\*|\*(.+?)\*|\[([^\]]+)\]\(([^)]+)\)")
+    text = str(text)
+    for match in pattern.finditer(text):
+        out.append(typst_escape(text[pos:match.start()]))
+        bold, italic, label, url = match.groups()
+        if bold is not None:
+            out.append(f"#strong[{markdown_to_typst(bold)}];")
+        elif italic is not None:
+            out.append(f"#emph[{markdown_to_typst(italic)}];")
+        else:
+            out.append(f"#link({typst_string(url)})[{markdown_to_typst(label)}];")
+        pos = match.end()
+    out.append(typst_escape(text[pos:]))
+    return "".join(out)
+
+
+def format_cv_date(value) -> str:
+    """Format YYYY-MM / YYYY-MM-DD / YYYY dates the way RenderCV does."""
+    if value is None:
+        return ""
+    text = str(value).strip()
+    if text.lower() == "present":
+        return "present"
+    match = re.fullmatch(r"(\d{4})-(\d{2})(?:-\d{2})?", text)
+    if match and 1 <= int(match.group(2)) <= 12:
+        return f"{MONTHS[int(match.group(2)) - 1]} {match.group(1)}"
+    return text
+
+
+def format_date_range(entry: dict) -> str:
+    if entry.get("date"):
+        return format_cv_date(entry["date"])
+    start = format_cv_date(entry.get("start_date"))
+    end = format_cv_date(entry.get("end_date")) or ("present" if start else "")
+    return f"{start} – {end}" if start else end
+
+
+def typst_content(text) -> str:
+    return f"[{markdown_to_typst(text)}]"
+
+
+def typst_highlights(entry: dict) -> str:
+    items = ", ".join(typst_content(h) for h in entry.get("highlights") or [])
+    return f"({items},)" if items else "()"
+
+
+def typst_entry(entry) -> str:
+    """Render one section entry, dispatching on its RenderCV entry shape."""
+    if not isinstance(entry, dict):
+        return f"#par[{markdown_to_typst(entry)}]\n"
+
+    date = typst_content(format_date_range(entry))
+    location = typst_content(entry.get("location", ""))
+    highlights = typst_highlights(entry)
+
+    if "institution" in entry:
+        degree = " in ".join(x for x in (entry.get("degree", ""), entry.get("area", "")) if x)
+        return (
+            f"#entry([#strong[{markdown_to_typst(entry['institution'])}]], {location},"
+            f" sub: {typst_content(degree)}, subside: {date}, highlights: {highlights})\n"
+        )
+    if "company" in entry:
+        return (
+            f"#entry([#strong[{markdown_to_typst(entry['company'])}], {markdown_to_typst(entry.get('position', ''))}],"
+            f" {location}, subside: {date}, highlights: {highlights})\n"
+        )
+    if "title" in entry and "authors" in entry:
+        authors = ", ".join(markdown_to_typst(a) for a in entry.get("authors") or [])
+        venue = markdown_to_typst(entry.get("journal", ""))
+        if entry.get("doi"):
+            doi = str(entry["doi"])
+            venue = f"#link({typst_string('https://doi.org/' + doi)})[{typst_escape(doi)}] ({venue})" if venue else \
+                f"#link({typst_string('https://doi.org/' + doi)})[{typst_escape(doi)}]"
+        elif entry.get("url"):
+            venue = f"#link({typst_string(entry['url'])})[{venue or typst_escape(entry['url'])}]"
+        return (
+            f"#entry([#strong[{markdown_to_typst(entry['title'])}]], {date},"
+            f" sub: [{authors}\\ #emph[{venue}]])\n"
+        )
+    if "label" in entry:
+        return f"#par[#strong[{markdown_to_typst(entry['label'])}:] {markdown_to_typst(entry.get('details', ''))}]\n"
+    if "bullet" in entry:
+        return f"#list[{markdown_to_typst(entry['bullet'])}]\n"
+    if "name" in entry:
+        summary = entry.get("summary")
+        sub = f" sub: {typst_content(summary)}," if summary else ""
+        return f"#entry([#strong[{markdown_to_typst(entry['name'])}]], {date},{sub} highlights: {highlights})\n"
+
+    # Unknown shape: list its values so nothing silently disappears
+    return f"#par[{markdown_to_typst(', '.join(str(v) for v in entry.values() if v))}]\n"
+
+
+def typst_header(cv: dict) -> str:
+    """Render the name and contact line."""
+    contacts = []
+    if cv.get("location"):
+        contacts.append(typst_escape(cv["location"]))
+    if cv.get("email"):
+        contacts.append(f"#link({typst_string('mailto:' + cv['email'])})[{typst_escape(cv['email'])}]")
+    if cv.get("phone"):
+        phone = str(cv["phone"])
+        number = phone.removeprefix("tel:")
+        contacts.append(f"#link({typst_string('tel:' + number)})[{typst_escape(number)}]")
+    if cv.get("website"):
+        website = str(cv["website"])
+        display = re.sub(r"^https?://", "", website).rstrip("/")
+        contacts.append(f"#link({typst_string(website)})[{typst_escape(display)}]")
+    for social in cv.get("social_networks") or []:
+        network = str(social.get("network", ""))
+        username = str(social.get("username", ""))
+        template = SOCIAL_URLS.get(network.lower())
+        label = f"{typst_escape(network)}: {typst_escape(username)}"
+        contacts.append(f"#link({typst_string(template.format(username))})[{label}]" if template else label)
+
+    lines = [
+        "#align(center)[",
+        f"  #text(size: 2.2em, weight: \"bold\", fill: primary)[{typst_escape(cv.get('name', ''))}]",
+    ]
+    if contacts:
+        lines.append("  #v(-0.3em)")
+        lines.append("  " + "#h(0.6em)|#h(0.6em)".join(f"#box[{c}]" for c in contacts))
+    lines.append("]")
+    return "\n".join(lines) + "\n"
+
+
+def typst_color(design: dict) -> str:
+    color = str(design.get("color") or "").strip()
+    if re.fullmatch(r"rgb\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\)", color):
+        return color
+    if re.fullmatch(r"#?[0-9a-fA-F]{6}", color):
+        return f'rgb("#{color.lstrip("#")}")'
+    return TYPST_DEFAULT_COLOR
+
+
+def typst_datetime(epoch: int) -> str:
+    d = datetime.fromtimestamp(epoch, timezone.utc)
+    return (f"datetime(year: {d.year}, month: {d.month}, day: {d.day}, "
+            f"hour: {d.hour}, minute: {d.minute}, second: {d.second})")
+
+
+def build_typst_source(rendercv_input: dict, source_date_epoch: int = 0) -> str:
+    """Build a Typst document from RenderCV input data.
+
+    The document date is fixed to source_date_epoch so output is reproducible.
+    Only a classic-style layout is produced; design.theme is not honoured.
+    """
+    cv = rendercv_input.get("cv", {})
+    design = rendercv_input.get("design") or {}
+    theme = design.get("theme")
+    if theme and theme != "classic":
+        print(f"WARNING: The typst engine ignores design.theme '{theme}' and renders a classic layout")
+    name = cv.get("name", "")
+    page_size = str(design.get("page_size", "letterpaper"))
+
+    parts = [
+        TYPST_PREAMBLE.format(
+            color=typst_color(design),
+            title=typst_string(f"{name} - CV"),
+            author=typst_string(name),
+            date=typst_datetime(source_date_epoch),
+            paper=TYPST_PAGE_SIZES.get(page_size, "us-letter"),
+        ),
+        typst_header(cv),
+    ]
+    for section_name, entries in (cv.get("sections") or {}).items():
+        if not entries:
+            continue
+        title = section_name.replace("_", " ").title()
+        parts.append(f"#section[{typst_escape(title)}]\n")
+        parts.extend(typst_entry(e) for e in entries)
+    return "\n".join(parts)
+
+
+def render_typst(rendercv_input: dict, work_dir: Path, source_date_epoch: int = 0) -> Path:
+    """Compile RenderCV input data to PDF with Typst; return the PDF path."""
+    try:
+        import typst
+    except ImportError:
+        raise RuntimeError("typst is not installed. Run: pip install -r scripts/requirements.txt")
+
+    source = work_dir / "cv.typ"
+    source.write_text(build_typst_source(rendercv_input, source_date_epoch), encoding="utf-8")
+    pdf_path = work_dir / "cv.pdf"
+    print(f"Running typst compile on {source}...")
+    typst.compile(str(source), output=str(pdf_path))
+    return pdf_path
+
+
+@contextmanager
+def render_cv(rendercv_input: dict | str, tex_cache: Path | None = None, engine: str = DEFAULT_ENGINE,
+              source_date_epoch: int = 0):
+    """Run RenderCV and yield the path to the generated PDF.
 
     rendercv_input can be a dict (YAML-dumped) or a raw YAML string
-    (written verbatim to preserve section order).
+    (written verbatim to preserve section order). The PDF lives inside
+    RenderCV's working directory and is removed when the context exits,
+    so callers must publish it before leaving the ``with`` block.
+
+    If tex_cache is set, LaTeX compilation goes through compile_latex().
+    With engine="typst" RenderCV is bypassed and render_typst() is used.
+    source_date_epoch pins embedded dates so identical input yields an
+    identical PDF (and therefore the same published hash).
     """
+    if engine == "typst":
+        if isinstance(rendercv_input, str):
+            rendercv_input = yaml.safe_load(rendercv_input)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield render_typst(rendercv_input, Path(tmpdir), source_date_epoch)
+        return
+
     with tempfile.TemporaryDirectory() as tmpdir:
         tmpdir_path = Path(tmpdir)
         input_file = tmpdir_path / "cv_input.yaml"
@@ -254,11 +678,19 @@ def render_cv(rendercv_input: dict | str) -> Path:
 
         print(f"Running rendercv render on {input_file}...")
 
+        command = ["rendercv", "render", str(input_file)]
+        if tex_cache is not None:
+            command += ["--use-local-latex-command", str(latex_wrapper(tex_cache))]
+
+        # pdfTeX honours these for CreationDate/ModDate, the PDF ID and \today
+        env = {**os.environ, "SOURCE_DATE_EPOCH": str(source_date_epoch), "FORCE_SOURCE_DATE": "1"}
+
         result = subprocess.run(
-            ["rendercv", "render", str(input_file)],
+            command,
             capture_output=True,
             text=True,
             cwd=tmpdir,
+            env=env,
             timeout=120,
         )
 
@@ -281,10 +713,7 @@ def render_cv(rendercv_input: dict | str) -> Path:
         if pdf_path is None:
             raise RuntimeError("RenderCV did not produce a PDF file")
 
-        # Copy to a stable temp location before tmpdir is cleaned up
-        stable_path = Path(tempfile.mktemp(suffix=".pdf"))
-        shutil.copy2(pdf_path, stable_path)
-        return stable_path
+        yield pdf_path
 
 
 def validate_pdf(pdf_path: Path) -> None:
@@ -304,11 +733,142 @@ def validate_pdf(pdf_path: Path) -> None:
     print(f"PDF validated: {size / 1024:.1f} KB")
 
 
-def write_metadata(pdf_size: int) -> None:
+def file_digest(path: Path) -> str:
+    """Return the truncated sha256 hex digest of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()[:HASH_LENGTH]
+
+
+def atomic_copy(src: Path, dest: Path) -> None:
+    """Copy src to dest via a temp file in dest's directory and os.replace.
+
+    Readers never observe a partially written file, and a crash mid-copy
+    leaves the previous dest untouched.
+    """
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{dest.name}.", suffix=".tmp", dir=dest.parent)
+    try:
+        with os.fdopen(fd, "wb") as out, open(src, "rb") as inp:
+            shutil.copyfileobj(inp, out)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, dest)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def hashed_pattern(stem: str) -> re.Pattern:
+    return re.compile(rf"^{re.escape(stem)}\.[0-9a-f]{{{HASH_LENGTH}}}\.pdf$")
+
+
+def source_date_epoch(source: Path) -> int:
+    """Return a stable timestamp for a CV source to embed in its PDF.
+
+    Honours an explicit SOURCE_DATE_EPOCH, otherwise uses the source file's
+    last commit time, falling back to 0 outside a git checkout.
+    """
+    if os.environ.get("SOURCE_DATE_EPOCH", "").isdigit():
+        return int(os.environ["SOURCE_DATE_EPOCH"])
+    try:
+        result = subprocess.run(
+            ["git", "log", "-1", "--format=%ct", "--", str(source)],
+            capture_output=True,
+            text=True,
+            cwd=ROOT,
+        )
+        return int(result.stdout.strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def publish_pdf(pdf_path: Path, dest_dir: Path, stem: str) -> tuple[Path, Path]:
+    """Publish a rendered PDF as <stem>.<hash>.pdf plus a <stem>.pdf alias.
+
+    The hashed file is written once (skipped if identical content is
+    already published). The version the alias pointed at before is kept
+    for one more generation so pages cached with its URL still resolve;
+    anything older is pruned. Returns (hashed_path, alias_path).
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    digest = file_digest(pdf_path)
+    hashed = dest_dir / f"{stem}.{digest}.pdf"
+    alias = dest_dir / f"{stem}.pdf"
+
+    previous = dest_dir / f"{stem}.{file_digest(alias)}.pdf" if alias.exists() else None
+
+    if previous == hashed and hashed.exists():
+        # Unchanged render: nothing to publish, keep the retained version too
+        return hashed, alias
+
+    if not hashed.exists():
+        atomic_copy(pdf_path, hashed)
+    atomic_copy(hashed, alias)
+
+    pattern = hashed_pattern(stem)
+    for old in dest_dir.glob(f"{stem}.*.pdf"):
+        if old not in (hashed, previous) and pattern.match(old.name):
+            old.unlink()
+            print(f"Removed stale {old.relative_to(ROOT)}")
+
+    return hashed, alias
+
+
+def public_url(path: Path) -> str:
+    """Map a file under public/ to its site URL."""
+    return "/" + path.relative_to(PUBLIC_DIR).as_posix()
+
+
+def write_cache_headers() -> None:
+    """Write public/_headers so CDNs cache hashed PDFs forever.
+
+    Covers every published hashed PDF (including retained previous
+    versions) and every alias. Understood by Netlify and Cloudflare Pages;
+    ignored by hosts that don't support it (the aliases work everywhere).
+    """
+    hashed_urls = []
+    alias_urls = []
+    main_pattern = hashed_pattern(OUTPUT_STEM)
+    for pdf in PUBLIC_DIR.glob(f"{OUTPUT_STEM}*.pdf"):
+        if main_pattern.match(pdf.name):
+            hashed_urls.append(public_url(pdf))
+        elif pdf.name == f"{OUTPUT_STEM}.pdf":
+            alias_urls.append(public_url(pdf))
+    person_pattern = re.compile(rf"^[^.]+\.[0-9a-f]{{{HASH_LENGTH}}}\.pdf$")
+    for pdf in PERSON_OUTPUT_DIR.glob("*.pdf") if PERSON_OUTPUT_DIR.exists() else []:
+        (hashed_urls if person_pattern.match(pdf.name) else alias_urls).append(public_url(pdf))
+
+    lines = ["# Generated by scripts/render-cv.py -- do not edit by hand."]
+    for url in sorted(hashed_urls):
+        lines += [url, "  Cache-Control: public, max-age=31536000, immutable"]
+    for url in sorted(alias_urls):
+        lines += [url, "  Cache-Control: public, max-age=0, must-revalidate"]
+    HEADERS_PATH.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    print(f"Cache headers written to {HEADERS_PATH}")
+
+
+def generated_at(previous: dict | None, pdf_url: str) -> str:
+    """Keep the previous timestamp when the published PDF didn't change."""
+    if previous and previous.get("pdfPath") == pdf_url and previous.get("lastGenerated"):
+        return previous["lastGenerated"]
+    return datetime.now(timezone.utc).isoformat()
+
+
+def load_json(path: Path) -> dict:
+    try:
+        with open(path, "r") as f:
+            return json.load(f) or {}
+    except (OSError, ValueError):
+        return {}
+
+
+def write_metadata(pdf_url: str, alias_url: str, pdf_size: int) -> None:
     """Write CV metadata JSON for the site to consume."""
     metadata = {
-        "lastGenerated": datetime.now(timezone.utc).isoformat(),
-        "pdfPath": "/cv.pdf",
+        "lastGenerated": generated_at(load_json(METADATA_PATH), pdf_url),
+        "pdfPath": pdf_url,
+        "aliasPath": alias_url,
         "pdfSize": pdf_size,
     }
 
@@ -320,11 +880,14 @@ def write_metadata(pdf_size: int) -> None:
     print(f"Metadata written to {METADATA_PATH}")
 
 
-def render_person_cvs() -> None:
-    """Render per-person CV PDFs from cv/*.yml files."""
+def render_person_cvs(tex_cache: Path | None = None, default_engine: str = DEFAULT_ENGINE) -> dict:
+    """Render per-person CV PDFs from cv/*.yml files.
+
+    Returns the per-person metadata.
+    """
     if not PERSON_CV_DIR.exists():
         print("No per-person CV directory found, skipping.")
-        return
+        return {}
 
     yml_files = sorted(PERSON_CV_DIR.glob("*.yml"))
     # Filter out .gitkeep and other non-CV files
@@ -332,9 +895,10 @@ def render_person_cvs() -> None:
 
     if not yml_files:
         print("No per-person CV files found, skipping.")
-        return
+        return {}
 
     PERSON_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    previous_meta = load_json(PERSON_META_PATH)
     person_meta: dict = {}
     errors: list[str] = []
 
@@ -350,18 +914,17 @@ def render_person_cvs() -> None:
                 print(f"WARNING: {cv_file.name} is empty or missing 'cv' section, skipping.")
                 continue
 
+            engine = resolve_engine(config, default_engine)
             rendercv_input = build_rendercv_input(config)
-            pdf_path = render_cv(rendercv_input)
-            validate_pdf(pdf_path)
-
-            dest = PERSON_OUTPUT_DIR / f"{person_id}.pdf"
-            shutil.copy2(pdf_path, dest)
+            with render_cv(rendercv_input, tex_cache, engine, source_date_epoch(cv_file)) as pdf_path:
+                validate_pdf(pdf_path)
+                dest, alias = publish_pdf(pdf_path, PERSON_OUTPUT_DIR, person_id)
             pdf_size = dest.stat().st_size
-            pdf_path.unlink(missing_ok=True)
 
             person_meta[person_id] = {
-                "lastGenerated": datetime.now(timezone.utc).isoformat(),
-                "pdfPath": f"/cv/{person_id}.pdf",
+                "lastGenerated": generated_at(previous_meta.get(person_id), public_url(dest)),
+                "pdfPath": public_url(dest),
+                "aliasPath": public_url(alias),
                 "pdfSize": pdf_size,
             }
 
@@ -381,8 +944,26 @@ def render_person_cvs() -> None:
     if errors:
         print(f"WARNING: Failed to render CVs for: {', '.join(errors)}")
 
+    return person_meta
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Render CV PDFs with RenderCV.")
+    parser.add_argument(
+        "--tex-cache",
+        nargs="?",
+        type=Path,
+        const=TEX_CACHE_DIR,
+        metavar="DIR",
+        help=f"compile with a precompiled preamble and persistent work dir (default: {TEX_CACHE_DIR.relative_to(ROOT)})",
+    )
+    parser.add_argument("--latex-compile", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Internal entry point: invoked by RenderCV through latex_wrapper()
+    if args.latex_compile:
+        sys.exit(compile_latex(args.latex_compile, args.tex_cache or TEX_CACHE_DIR))
+
     # Check for raw YAML upload first (takes priority)
     upload_result = load_upload()
 
@@ -407,9 +988,24 @@ def main():
         # Build RenderCV input from structured config
         rendercv_input = build_rendercv_input(config)
 
-    # Render PDF
+    # The upload sync preserves `engine`, so config/cv.yml is authoritative here
+    try:
+        engine = resolve_engine(load_config() if CONFIG_PATH.exists() else {})
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    print(f"Rendering with the {engine} engine")
+
+    # Render, validate, and publish the PDF straight from the engine's output
     try:
-        pdf_path = render_cv(rendercv_input)
+        source = UPLOAD_PATH if upload_result else CONFIG_PATH
+        with render_cv(rendercv_input, args.tex_cache, engine, source_date_epoch(source)) as pdf_path:
+            try:
+                validate_pdf(pdf_path)
+            except RuntimeError as e:
+                print(f"ERROR: PDF validation failed: {e}")
+                sys.exit(1)
+            hashed, alias = publish_pdf(pdf_path, PUBLIC_DIR, OUTPUT_STEM)
     except subprocess.TimeoutExpired:
         print("ERROR: RenderCV timed out after 120 seconds")
         sys.exit(1)
@@ -417,30 +1013,18 @@ def main():
         print(f"ERROR: Failed to render CV: {e}")
         sys.exit(1)
 
-    # Validate
-    try:
-        validate_pdf(pdf_path)
-    except RuntimeError as e:
-        print(f"ERROR: PDF validation failed: {e}")
-        pdf_path.unlink(missing_ok=True)
-        sys.exit(1)
-
-    # Copy to public/cv.pdf
-    OUTPUT_PDF.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(pdf_path, OUTPUT_PDF)
-    pdf_size = OUTPUT_PDF.stat().st_size
-    print(f"PDF written to {OUTPUT_PDF}")
-
-    # Clean up temp PDF
-    pdf_path.unlink(missing_ok=True)
+    pdf_size = hashed.stat().st_size
+    print(f"PDF written to {hashed} (alias {alias})")
 
     # Write metadata
-    write_metadata(pdf_size)
+    write_metadata(public_url(hashed), public_url(alias), pdf_size)
 
     print("\nCV render complete!")
 
     # Render per-person CVs
-    render_person_cvs()
+    render_person_cvs(args.tex_cache, engine)
+
+    write_cache_headers()
 
 
 if __name__ == "__main__":
@@ -5,33 +5,71 @@ Sync publications from Google Scholar.
 Reads author IDs from config/scholar.yml, fetches publication metadata
 via the `scholarly` library, and writes individual markdown files to
 src/content/publications/.
+
+Large author lists can be split across parallel jobs:
+
+    sync-scholar.py --shard 1/3   # fetch a third of the authors -> shard file
+    sync-scholar.py --shard 2/3
+    sync-scholar.py --shard 3/3
+    sync-scholar.py merge         # dedupe/merge/override all shards once
+
+Per-paper fills can be capped with --budget (e.g. `45m` or `300` requests).
+Fills are scheduled new papers first, then stale papers from recent years,
+and refresh times are persisted so repeated short runs converge on a fully
+fresh corpus.
+
+`--citations-only` skips per-paper fills entirely: it reads citation counts,
+titles and years from each author's publication listing (one fill per
+author), patches changed titles/years in place, and appends changed counts
+to src/data/citations.jsonl.
+
+Every write also rebuilds src/data/author-index.json, mapping normalized
+author names to their publication ids, co-author counts and per-year totals;
+`sync-scholar.py index` rebuilds it from the local corpus without fetching.
+
+With `outputFormat: json` in config/scholar.yml the corpus is written as one
+stable-ordered src/data/publications.json instead of a .md file per paper;
+publications with a Markdown body keep their per-paper file.
 """
 
+import argparse
 import json
 import os
 import re
 import sys
 import time
+import unicodedata
+from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
 from pathlib import Path
 
 import yaml
 
-try:
-    from scholarly import scholarly
-except ImportError:
-    print("ERROR: scholarly is not installed. Run: pip install -r scripts/requirements.txt")
-    sys.exit(1)
+# Imported by load_scholarly() so `index` and `merge` run without it
+scholarly = None
 
 
 ROOT = Path(__file__).resolve().parent.parent
 CONFIG_PATH = ROOT / "config" / "scholar.yml"
 OVERRIDE_PATH = ROOT / "config" / "publications.override.yml"
 OUTPUT_DIR = ROOT / "src" / "content" / "publications"
+SHARD_DIR = ROOT / ".scholar-shards"
+SYNC_STATE_PATH = ROOT / "src" / "data" / "scholar-sync-state.json"
+CITATIONS_PATH = ROOT / "src" / "data" / "citations.jsonl"
+AUTHOR_INDEX_PATH = ROOT / "src" / "data" / "author-index.json"
+PUBLICATIONS_DATA_PATH = ROOT / "src" / "data" / "publications.json"
+OUTPUT_FORMATS = ("markdown", "json")
+
+# Frontmatter / data file fields, in output order
+PUBLICATION_FIELDS = ("title", "authors", "venue", "year", "doi", "url", "pdf",
+                      "type", "featured", "abstract", "bibtex", "image")
 
 # Delay between scholarly API calls to avoid rate-limiting
 FETCH_DELAY = 4  # seconds
 
+# Papers filled more recently than this are scheduled after all stale ones
+FRESH_AFTER = timedelta(days=7)
+
 
 def load_config():
     with open(CONFIG_PATH, "r") as f:
@@ -50,29 +88,33 @@ def load_overrides():
     }
 
 
-def parse_frontmatter(filepath: Path) -> dict:
-    """Read a .md file and extract YAML frontmatter as a dict."""
-    text = filepath.read_text(encoding="utf-8")
+def get_output_format(config: dict) -> str:
+    """Return the configured corpus output format (markdown or json)."""
+    output_format = str(config.get("outputFormat") or "markdown").lower()
+    if output_format not in OUTPUT_FORMATS:
+        print(f"ERROR: Unknown outputFormat '{output_format}' (expected one of: {', '.join(OUTPUT_FORMATS)})")
+        sys.exit(1)
+    return output_format
+
+
+def split_frontmatter(text: str) -> tuple[dict, str]:
+    """Split a Markdown document into (frontmatter dict, body)."""
     if not text.startswith("---"):
-        return {}
+        return {}, text
     parts = text.split("---", 2)
     if len(parts) < 3:
-        return {}
+        return {}, text
     try:
-        return yaml.safe_load(parts[1]) or {}
+        fm = yaml.safe_load(parts[1]) or {}
     except yaml.YAMLError:
-        return {}
-
+        return {}, text
+    return fm, parts[2].removeprefix("\n")
 
-def write_publication_md(pub: dict, output_dir: Path) -> None:
-    """Write a publication as a .md file with YAML frontmatter."""
-    pub_id = pub.get("id", "unknown")
-    filepath = output_dir / f"{pub_id}.md"
 
-    # Build frontmatter dict (exclude 'id' since it comes from filename)
+def publication_fields(pub: dict) -> dict:
+    """Return a publication's schema fields in output order, with defaults."""
     fm = {}
-    for key in ("title", "authors", "venue", "year", "doi", "url", "pdf",
-                 "type", "featured", "abstract", "bibtex", "image"):
+    for key in PUBLICATION_FIELDS:
         if key in pub and pub[key] is not None:
             fm[key] = pub[key]
 
@@ -84,23 +126,87 @@ def write_publication_md(pub: dict, output_dir: Path) -> None:
     fm.setdefault("type", "conference")
     fm.setdefault("featured", False)
     fm.setdefault("image", "")
+    return fm
+
+
+def write_publication_md(pub: dict, output_dir: Path) -> None:
+    """Write a publication as a .md file with YAML frontmatter and its body."""
+    pub_id = pub.get("id", "unknown")
+    filepath = output_dir / f"{pub_id}.md"
+
+    # Build frontmatter dict (exclude 'id' since it comes from filename)
+    fm = publication_fields(pub)
 
     frontmatter = yaml.dump(fm, default_flow_style=False, allow_unicode=True, sort_keys=False)
-    content = f"---\n{frontmatter}---\n"
+    content = f"---\n{frontmatter}---\n{pub.get('body') or ''}"
 
     filepath.write_text(content, encoding="utf-8")
 
 
+def write_publications_data(pubs: list[dict]) -> None:
+    """Write publications as one JSON array, one compact entry per line.
+
+    Entries keep the corpus order (sort_publications) so diffs stay small.
+    """
+    lines = [
+        json.dumps({"id": pub["id"], **publication_fields(pub)}, ensure_ascii=False, separators=(",", ":"))
+        for pub in pubs
+    ]
+    PUBLICATIONS_DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+    PUBLICATIONS_DATA_PATH.write_text("[\n" + ",\n".join(lines) + "\n]\n", encoding="utf-8")
+
+
+def write_corpus(pubs: list[dict], output_format: str) -> None:
+    """Write the sorted corpus in the configured format.
+
+    Markdown mode writes every publication as a .md file (absorbing any
+    publications.json). JSON mode writes publications without a Markdown
+    body to publications.json and removes their now-redundant .md files.
+    Files for publications outside `pubs` are never deleted.
+    """
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    if output_format == "markdown":
+        for pub in pubs:
+            write_publication_md(pub, OUTPUT_DIR)
+        if PUBLICATIONS_DATA_PATH.exists():
+            PUBLICATIONS_DATA_PATH.unlink()
+            print(f"Moved {PUBLICATIONS_DATA_PATH.name} entries back to per-paper files")
+        return
+
+    data_pubs = []
+    for pub in pubs:
+        if (pub.get("body") or "").strip():
+            write_publication_md(pub, OUTPUT_DIR)
+        else:
+            data_pubs.append(pub)
+            (OUTPUT_DIR / f"{pub['id']}.md").unlink(missing_ok=True)
+    write_publications_data(data_pubs)
+    print(f"Wrote {len(data_pubs)} publication(s) to {PUBLICATIONS_DATA_PATH}, "
+          f"{len(pubs) - len(data_pubs)} with bodies as .md files")
+
+
 def load_existing() -> list[dict]:
-    """Scan OUTPUT_DIR/*.md, parse frontmatter, set id from filename stem."""
-    if not OUTPUT_DIR.exists():
-        return []
+    """Load the corpus from OUTPUT_DIR/*.md (id from filename) and publications.json.
+
+    A publication present in both keeps its .md version.
+    """
     pubs = []
-    for md_file in OUTPUT_DIR.glob("*.md"):
-        fm = parse_frontmatter(md_file)
-        if fm:
-            fm["id"] = md_file.stem
-            pubs.append(fm)
+    seen = set()
+    if OUTPUT_DIR.exists():
+        for md_file in OUTPUT_DIR.glob("*.md"):
+            fm, body = split_frontmatter(md_file.read_text(encoding="utf-8"))
+            if fm:
+                fm["id"] = md_file.stem
+                if body.strip():
+                    fm["body"] = body
+                pubs.append(fm)
+                seen.add(md_file.stem)
+    if PUBLICATIONS_DATA_PATH.exists():
+        with open(PUBLICATIONS_DATA_PATH, "r", encoding="utf-8") as f:
+            for entry in json.load(f):
+                if entry.get("id") and entry["id"] not in seen:
+                    pubs.append(entry)
     return pubs
 
 
@@ -275,6 +381,84 @@ def sort_publications(pubs: list[dict]) -> list[dict]:
     return sorted(pubs, key=lambda p: (-p.get("year", 0), p.get("title", "")))
 
 
+def normalize_author(name: str) -> str:
+    """Normalize an author name for index lookups.
+
+    Must stay in sync with normalizeAuthorName() in src/lib/utils.ts.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.category(c).startswith("M"))
+    return re.sub(r"[^a-z0-9]+", " ", stripped.lower()).strip()
+
+
+def author_alias(key: str) -> str:
+    """Alias key (first initial + last name) for a normalized author name.
+
+    Groups spellings like "mehdi yazdani jahromi" and "m yazdani jahromi".
+    Must stay in sync with authorAliasKey() in src/lib/utils.ts.
+    """
+    tokens = key.split()
+    if len(tokens) < 2:
+        return ""
+    return f"{tokens[0][0]} {tokens[-1]}"
+
+
+def build_author_index(pubs: list[dict]) -> dict:
+    """Build the author index in a single pass over sorted publications.
+
+    Publication id lists keep the corpus order (newest first); the display
+    name is the first spelling seen for each normalized name. "aliases" maps
+    each author_alias() to the normalized names sharing it, so pages can find
+    every spelling of a person with direct lookups.
+    """
+    authors = {}
+    for pub in pubs:
+        names = {}
+        for raw in pub.get("authors") or []:
+            key = normalize_author(str(raw))
+            if key:
+                names.setdefault(key, str(raw).replace("*", "").strip())
+
+        year = str(pub.get("year", 0))
+        for key, display in names.items():
+            entry = authors.setdefault(key, {"name": display, "publications": [], "coauthors": {}, "years": {}})
+            entry["publications"].append(pub["id"])
+            entry["years"][year] = entry["years"].get(year, 0) + 1
+            for other in names:
+                if other != key:
+                    entry["coauthors"][other] = entry["coauthors"].get(other, 0) + 1
+
+    aliases = {}
+    for key, entry in sorted(authors.items()):
+        entry["coauthors"] = dict(sorted(entry["coauthors"].items(), key=lambda kv: (-kv[1], kv[0])))
+        entry["years"] = dict(sorted(entry["years"].items(), reverse=True))
+        alias = author_alias(key)
+        if alias:
+            aliases.setdefault(alias, []).append(key)
+
+    return {"authors": dict(sorted(authors.items())), "aliases": dict(sorted(aliases.items()))}
+
+
+def write_author_index(pubs: list[dict]) -> None:
+    """Write src/data/author-index.json for people and co-author pages."""
+    index = build_author_index(pubs)
+    AUTHOR_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(AUTHOR_INDEX_PATH, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    print(f"Author index written to {AUTHOR_INDEX_PATH} ({len(index['authors'])} authors)")
+
+
+def load_scholarly() -> None:
+    """Import scholarly, which only the fetching commands need."""
+    global scholarly
+    try:
+        from scholarly import scholarly
+    except ImportError:
+        print("ERROR: scholarly is not installed. Run: pip install -r scripts/requirements.txt")
+        sys.exit(1)
+
+
 def setup_proxy():
     """Enable free proxy rotation if USE_PROXY=1."""
     if os.environ.get("USE_PROXY", "0") == "1":
@@ -289,22 +473,135 @@ def setup_proxy():
             print(f"WARNING: Failed to set up proxy: {e}")
 
 
-def main():
-    config = load_config()
-    authors_config = config.get("authors", [])
-    max_results = config.get("maxResults", 100)
+def parse_budget(value: str) -> tuple[float | None, int | None]:
+    """Parse a --budget spec: '<N>m' for minutes or '<N>' for requests."""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*(m|min)?", value.strip().lower())
+    if not match:
+        raise argparse.ArgumentTypeError(f"expected minutes like '45m' or a request count, got '{value}'")
+    if match.group(2):
+        return float(match.group(1)), None
+    if "." in match.group(1):
+        raise argparse.ArgumentTypeError(f"request budget must be a whole number, got '{value}'")
+    return None, int(match.group(1))
+
+
+class FetchBudget:
+    """Caps a sync run by wall-clock minutes and/or number of scholarly requests."""
+
+    def __init__(self, minutes: float | None = None, requests: int | None = None):
+        self.deadline = time.monotonic() + minutes * 60 if minutes is not None else None
+        self.remaining = requests
+
+    def exhausted(self) -> bool:
+        if self.remaining is not None and self.remaining <= 0:
+            return True
+        # Leave room for the request itself plus the politeness delay
+        return self.deadline is not None and time.monotonic() + FETCH_DELAY >= self.deadline
+
+    def spend(self, requests: int = 1) -> None:
+        if self.remaining is not None:
+            self.remaining -= requests
+
+
+def load_sync_state() -> dict:
+    """Load per-paper fill timestamps persisted by previous runs.
+
+    "refreshed" records the last successful fill of each paper, "attempted"
+    the last fill tried, whether or not it succeeded. "ids" maps Scholar
+    author_pub_ids to corpus ids confirmed by an exact title match.
+    """
+    if not SYNC_STATE_PATH.exists():
+        return {"refreshed": {}, "attempted": {}, "ids": {}}
+    with open(SYNC_STATE_PATH, "r", encoding="utf-8") as f:
+        data = json.load(f) or {}
+    for field in ("refreshed", "attempted", "ids"):
+        data.setdefault(field, {})
+    return data
+
+
+def save_sync_state(state: dict) -> None:
+    SYNC_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    for field in ("refreshed", "attempted", "ids"):
+        state[field] = dict(sorted(state[field].items()))
+    with open(SYNC_STATE_PATH, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def listing_key(pub) -> str:
+    """Stable key for a publication from an author listing."""
+    return pub.get("author_pub_id") or normalize_title(pub.get("bib", {}).get("title", ""))
+
+
+def schedule_fills(listing: list, existing: list[dict], state: dict) -> list:
+    """Order listing entries by the expected value of filling them.
+
+    New papers come first, then papers not refreshed within FRESH_AFTER
+    (most recent years first, then least recently refreshed), then papers
+    whose last fill failed within FRESH_AFTER, then the rest. Duplicate
+    papers listed under several authors are filled once.
+    """
+    refreshed = state.get("refreshed", {})
+    attempted = state.get("attempted", {})
+    known_titles = {normalize_title(p.get("title", "")) for p in existing}
+    fresh_cutoff = (datetime.now(timezone.utc) - FRESH_AFTER).isoformat()
+
+    unique = {}
+    for pub in listing:
+        unique.setdefault(normalize_title(pub.get("bib", {}).get("title", "")), pub)
+
+    def priority(pub):
+        bib = pub.get("bib", {})
+        key = listing_key(pub)
+        last = refreshed.get(key, "")
+        tried = attempted.get(key, "")
+        # A fill that failed recently is retried only after stale papers
+        failed = tried > last and tried >= fresh_cutoff
+        is_new = normalize_title(bib.get("title", "")) not in known_titles and not last and not failed
+        try:
+            year = int(bib.get("pub_year") or 0)
+        except (TypeError, ValueError):
+            year = 0
+        return (not is_new, last >= fresh_cutoff, failed, -year, last)
 
-    if not authors_config:
-        print("No authors configured in config/scholar.yml")
-        sys.exit(1)
+    return sorted(unique.values(), key=priority)
 
-    setup_proxy()
 
-    existing = load_existing()
-    all_pubs = []
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse an 'i/n' shard spec (1-based) for argparse."""
+    match = re.fullmatch(r"(\d+)/(\d+)", value.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"expected i/n, got '{value}'")
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard index must be in 1..{count}, got {index}")
+    return index, count
+
+
+def select_shard(authors_config: list[dict], index: int, count: int) -> list[dict]:
+    """Return the deterministic subset of authors belonging to shard index/count.
+
+    Authors are ordered by scholar_id (then name) and dealt round-robin, so
+    the assignment is independent of config ordering and shards stay balanced.
+    """
+    ordered = sorted(authors_config, key=lambda a: (a.get("scholar_id", ""), a.get("name", "")))
+    return [a for i, a in enumerate(ordered) if i % count == index - 1]
+
+
+def shard_path(index: int, count: int) -> Path:
+    return SHARD_DIR / f"shard-{index}-of-{count}.json"
+
+
+def fetch_authors(authors_config: list[dict], max_results: int, budget: FetchBudget,
+                  existing: list[dict], state: dict) -> tuple[list[dict], int, int, dict]:
+    """Fetch author listings, then fill papers in priority order within budget.
+
+    Returns (publications, author_success, author_fail, stamps) where stamps
+    holds the "refreshed" and "attempted" timestamps of fills made this run.
+    """
+    listing = []
     author_success = 0
     author_fail = 0
-    total_fetched = 0
 
     for author_cfg in authors_config:
         name = author_cfg.get("name", "Unknown")
@@ -315,28 +612,21 @@ def main():
             author_fail += 1
             continue
 
+        if budget.exhausted():
+            print(f"BUDGET: Exhausted before fetching '{name}'")
+            author_fail += 1
+            continue
+
         print(f"\nFetching publications for {name} ({scholar_id})...")
         try:
             author = scholarly.search_author_id(scholar_id)
             author = scholarly.fill(author, sections=["publications"])
+            budget.spend(2)
 
             pubs = author.get("publications", [])[:max_results]
-            print(f"  Found {len(pubs)} publications, fetching details...")
-
-            for i, pub in enumerate(pubs):
-                try:
-                    filled = scholarly.fill(pub)
-                    mapped = map_publication(filled)
-                    if mapped["year"] > 0:  # Skip entries without valid year
-                        all_pubs.append(mapped)
-                        total_fetched += 1
-                except Exception as e:
-                    print(f"  WARNING: Failed to fetch details for pub #{i}: {e}")
-
-                time.sleep(FETCH_DELAY)
-
+            listing.extend(pubs)
             author_success += 1
-            print(f"  Done: {len(pubs)} processed for {name}")
+            print(f"  Found {len(pubs)} publications for {name}")
 
         except Exception as e:
             print(f"  ERROR: Failed to fetch author '{name}': {e}")
@@ -344,11 +634,37 @@ def main():
 
         time.sleep(FETCH_DELAY)
 
-    # If ALL authors failed, exit without writing (preserve existing data)
-    if author_success == 0:
-        print(f"\nERROR: All {author_fail} author(s) failed. Preserving existing data.")
-        sys.exit(1)
+    queue = schedule_fills(listing, existing, state)
+    print(f"\nFilling details for up to {len(queue)} publication(s) in priority order...")
+
+    all_pubs = []
+    stamps = {"refreshed": {}, "attempted": {}}
+    for i, pub in enumerate(queue):
+        if budget.exhausted():
+            print(f"BUDGET: Stopping after {i} fill(s); {len(queue) - i} deferred to the next run")
+            break
+        key = listing_key(pub)
+        stamps["attempted"][key] = datetime.now(timezone.utc).isoformat()
+        try:
+            filled = scholarly.fill(pub)
+            mapped = map_publication(filled)
+            if mapped["year"] > 0:  # Skip entries without valid year
+                all_pubs.append(mapped)
+            stamps["refreshed"][key] = stamps["attempted"][key]
+        except Exception as e:
+            print(f"  WARNING: Failed to fetch details for '{pub.get('bib', {}).get('title', i)}': {e}")
+        budget.spend()
+
+        time.sleep(FETCH_DELAY)
+
+    return all_pubs, author_success, author_fail, stamps
 
+
+def write_results(all_pubs: list[dict], existing: list[dict], output_format: str) -> list[dict]:
+    """Deduplicate, merge, apply overrides, sort, and write the corpus.
+
+    Returns the merged corpus for summary reporting.
+    """
     # Deduplicate across authors
     all_pubs = deduplicate(all_pubs)
 
@@ -362,16 +678,19 @@ def main():
     # Sort
     merged = sort_publications(merged)
 
-    # Ensure output directory exists
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    # Write the corpus (do NOT delete files not in new set)
+    write_corpus(merged, output_format)
+
+    write_author_index(merged)
+
+    return merged
 
-    # Write individual .md files (do NOT delete files not in new set)
-    for pub in merged:
-        write_publication_md(pub, OUTPUT_DIR)
 
+def print_summary(author_success: int, author_total: int, author_fail: int,
+                  total_fetched: int, merged: list[dict], existing: list[dict]) -> None:
     added = len(merged) - len(existing)
     print(f"\nSummary:")
-    print(f"  Authors fetched: {author_success}/{len(authors_config)}")
+    print(f"  Authors fetched: {author_success}/{author_total}")
     print(f"  Publications fetched: {total_fetched}")
     print(f"  Total after merge: {len(merged)}")
     print(f"  Net change: {'+' if added >= 0 else ''}{added}")
@@ -379,5 +698,364 @@ def main():
         print(f"  Warnings: {author_fail} author(s) failed")
 
 
+def run_shard(authors_config: list[dict], max_results: int, budget: FetchBudget,
+              index: int, count: int) -> None:
+    """Fetch one shard of authors and write a partial result file."""
+    shard_authors = select_shard(authors_config, index, count)
+    print(f"Shard {index}/{count}: {len(shard_authors)} of {len(authors_config)} author(s)")
+
+    all_pubs, author_success, author_fail, stamps = fetch_authors(
+        shard_authors, max_results, budget, load_existing(), load_sync_state()
+    )
+
+    SHARD_DIR.mkdir(parents=True, exist_ok=True)
+    path = shard_path(index, count)
+    result = {
+        "shard": f"{index}/{count}",
+        "authors": [a.get("scholar_id", "") for a in shard_authors],
+        "authorSuccess": author_success,
+        "authorFail": author_fail,
+        "refreshed": stamps["refreshed"],
+        "attempted": stamps["attempted"],
+        "publications": all_pubs,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+    print(f"\nShard {index}/{count}: {len(all_pubs)} publication(s) written to {path}")
+    if shard_authors and author_success == 0:
+        print(f"ERROR: All {author_fail} author(s) in shard failed.")
+        sys.exit(1)
+
+
+def merge_timestamps(target: dict, updates: dict) -> None:
+    """Merge ISO timestamps into target, keeping the newer value per key."""
+    for key, stamp in updates.items():
+        if stamp > target.get(key, ""):
+            target[key] = stamp
+
+
+def load_shard_set(shard_files: list[Path]) -> list[tuple[Path, dict]]:
+    """Load shard files and check they form one complete set 1..n.
+
+    Exits with an error on mixed shard counts, duplicates, or missing shards.
+    Returns (path, data) pairs in shard index order.
+    """
+    shards = {}
+    counts = set()
+    for path in shard_files:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        try:
+            index, count = parse_shard(str(data.get("shard", "")))
+        except argparse.ArgumentTypeError:
+            print(f"ERROR: {path} has no valid 'shard' field")
+            sys.exit(1)
+        if index in shards:
+            print(f"ERROR: Shard {index}/{count} given twice ({shards[index][0]} and {path})")
+            sys.exit(1)
+        shards[index] = (path, data)
+        counts.add(count)
+
+    if len(counts) != 1:
+        print(f"ERROR: Shard files come from different splits (n = {', '.join(map(str, sorted(counts)))})")
+        sys.exit(1)
+    count = counts.pop()
+    missing = sorted(set(range(1, count + 1)) - set(shards))
+    if missing:
+        print(f"ERROR: Missing shard(s) {', '.join(f'{i}/{count}' for i in missing)}; not merging a partial set")
+        sys.exit(1)
+
+    return [shards[i] for i in sorted(shards)]
+
+
+def run_merge(shard_files: list[Path]) -> None:
+    """Combine a complete set of shard files and run the merge pipeline once.
+
+    The shard files are deleted after a successful merge so they can't be
+    merged again by a later run.
+    """
+    if not shard_files:
+        shard_files = sorted(SHARD_DIR.glob("shard-*-of-*.json"))
+    if not shard_files:
+        print(f"ERROR: No shard files found in {SHARD_DIR}")
+        sys.exit(1)
+
+    # Merge shards in index order so dedup keeps the same winner every run
+    shards = load_shard_set(shard_files)
+
+    all_pubs = []
+    author_success = 0
+    author_fail = 0
+    author_total = 0
+    state = load_sync_state()
+    for path, data in shards:
+        print(f"Loaded shard {data['shard']}: {len(data.get('publications', []))} publication(s)")
+        all_pubs.extend(data.get("publications", []))
+        author_success += data.get("authorSuccess", 0)
+        author_fail += data.get("authorFail", 0)
+        author_total += len(data.get("authors", []))
+        merge_timestamps(state["refreshed"], data.get("refreshed", {}))
+        merge_timestamps(state["attempted"], data.get("attempted", {}))
+
+    # If ALL authors failed, exit without writing (preserve existing data)
+    if author_success == 0:
+        print(f"\nERROR: All {author_fail} author(s) failed. Preserving existing data.")
+        sys.exit(1)
+
+    existing = load_existing()
+    merged = write_results(all_pubs, existing, get_output_format(load_config()))
+    save_sync_state(state)
+
+    for path, _ in shards:
+        path.unlink(missing_ok=True)
+    print(f"Removed {len(shards)} merged shard file(s)")
+
+    print_summary(author_success, author_total, author_fail, len(all_pubs), merged, existing)
+
+
+def latest_citations() -> dict:
+    """Replay citations.jsonl into the most recent count per publication id."""
+    counts = {}
+    if not CITATIONS_PATH.exists():
+        return counts
+    with open(CITATIONS_PATH, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                counts.update(json.loads(line).get("citations", {}))
+    return counts
+
+
+def append_citations(counts: dict) -> int:
+    """Append counts that changed since the last record as one JSONL line.
+
+    Returns the number of publications recorded (0 if nothing changed).
+    """
+    previous = latest_citations()
+    changed = {pub_id: n for pub_id, n in sorted(counts.items()) if previous.get(pub_id) != n}
+    if not changed:
+        return 0
+    record = {"date": datetime.now(timezone.utc).date().isoformat(), "citations": changed}
+    CITATIONS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(CITATIONS_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+    return len(changed)
+
+
+def match_existing(entry, existing: list[dict], by_title: dict, by_id: dict,
+                   known_ids: dict) -> tuple[dict | None, bool]:
+    """Find the existing publication for a listing entry.
+
+    Tries the stored author_pub_id mapping, then an exact normalized title,
+    then a fuzzy title match. Returns (publication, exact) where exact is
+    False for fuzzy matches, which may update citation counts but nothing else.
+    """
+    pub = by_id.get(known_ids.get(entry.get("author_pub_id", "")))
+    if pub:
+        return pub, True
+    title = entry.get("bib", {}).get("title", "")
+    pub = by_title.get(normalize_title(title))
+    if pub:
+        return pub, True
+    for candidate in existing:
+        if titles_similar(title, candidate.get("title", "")):
+            return candidate, False
+    return None, False
+
+
+def run_citations_refresh(authors_config: list[dict], output_format: str) -> None:
+    """Refresh citation counts, titles and years from author listings only.
+
+    Titles and years are patched only for unambiguous matches: an exact title
+    or a stored author_pub_id, and a single listing entry for that paper.
+    """
+    existing = load_existing()
+    by_title = {normalize_title(p.get("title", "")): p for p in existing}
+    by_id = {p["id"]: p for p in existing}
+    state = load_sync_state()
+
+    counts = {}
+    proposed = {}
+    changed = {}
+    unmatched = 0
+    author_success = 0
+    author_fail = 0
+
+    for author_cfg in authors_config:
+        name = author_cfg.get("name", "Unknown")
+        scholar_id = author_cfg.get("scholar_id", "")
+
+        if not scholar_id:
+            print(f"SKIP: No scholar_id for '{name}'")
+            author_fail += 1
+            continue
+
+        print(f"\nFetching publication listing for {name} ({scholar_id})...")
+        try:
+            author = scholarly.search_author_id(scholar_id)
+            author = scholarly.fill(author, sections=["publications"])
+            author_success += 1
+        except Exception as e:
+            print(f"  ERROR: Failed to fetch author '{name}': {e}")
+            author_fail += 1
+            continue
+
+        for entry in author.get("publications", []):
+            pub, exact = match_existing(entry, existing, by_title, by_id, state["ids"])
+            if pub is None:
+                unmatched += 1
+                continue
+
+            # Co-authors may list the same paper; keep the highest count
+            num = int(entry.get("num_citations") or 0)
+            counts[pub["id"]] = max(num, counts.get(pub["id"], 0))
+
+            if not exact:
+                continue
+            if entry.get("author_pub_id"):
+                state["ids"][entry["author_pub_id"]] = pub["id"]
+
+            bib = entry.get("bib", {})
+            try:
+                year = int(bib.get("pub_year") or 0)
+            except (TypeError, ValueError):
+                year = 0
+            # Keyed so that co-authors' copies of the same entry count once
+            key = (normalize_title(bib.get("title", "")), year)
+            proposed.setdefault(pub["id"], {})[key] = (bib.get("title", ""), year)
+
+        time.sleep(FETCH_DELAY)
+
+    if author_success == 0:
+        print(f"\nERROR: All {author_fail} author(s) failed. Preserving existing data.")
+        sys.exit(1)
+
+    for pub_id, entries in proposed.items():
+        # A preprint and its published version can both match one paper;
+        # patching from either would flip the year back and forth
+        if len(entries) != 1:
+            print(f"  Skipping title/year update for {pub_id}: {len(entries)} listing entries match")
+            continue
+        pub = by_id[pub_id]
+        title, year = next(iter(entries.values()))
+        if year and year != pub.get("year"):
+            print(f"  Year changed for {pub_id}: {pub.get('year')} -> {year}")
+            pub["year"] = year
+            changed[pub_id] = pub
+        if title and normalize_title(title) != normalize_title(pub.get("title", "")):
+            print(f"  Title changed for {pub_id}: '{pub.get('title')}' -> '{title}'")
+            pub["title"] = title
+            changed[pub_id] = pub
+
+    if changed:
+        # Manual overrides win over listing data; additions are already in the corpus
+        overrides = load_overrides()
+        existing = apply_overrides(existing, {**overrides, "additions": []})
+        if output_format == "json":
+            write_corpus(sort_publications(existing), output_format)
+        else:
+            for pub in changed.values():
+                write_publication_md(pub, OUTPUT_DIR)
+        write_author_index(sort_publications(existing))
+
+    recorded = append_citations(counts)
+    save_sync_state(state)
+
+    print(f"\nSummary:")
+    print(f"  Authors fetched: {author_success}/{len(authors_config)}")
+    print(f"  Publications matched: {len(counts)}")
+    print(f"  Citation counts changed: {recorded}")
+    print(f"  Title/year updates: {len(changed)}")
+    if unmatched:
+        print(f"  Not in corpus: {unmatched} (run a full sync to add them)")
+    if author_fail > 0:
+        print(f"  Warnings: {author_fail} author(s) failed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync publications from Google Scholar.")
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="I/N",
+        help="fetch only shard I of N (1-based) and write a partial result file",
+    )
+    parser.add_argument(
+        "--budget",
+        type=parse_budget,
+        metavar="N[m]",
+        help="stop fetching after N minutes ('45m') or N scholarly requests ('300')",
+    )
+    parser.add_argument(
+        "--citations-only",
+        action="store_true",
+        help="refresh citation counts, titles and years from author listings without per-paper fills",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    merge_parser = subparsers.add_parser("merge", help="merge shard result files into the publication corpus")
+    merge_parser.add_argument(
+        "files",
+        nargs="*",
+        type=Path,
+        help=f"shard files to merge (default: all in {SHARD_DIR.relative_to(ROOT)}/)",
+    )
+    subparsers.add_parser("index", help="rebuild the author index from the local corpus without fetching")
+    args = parser.parse_args()
+
+    # Reject flags that would otherwise be silently ignored
+    if args.citations_only and (args.shard or args.budget):
+        parser.error("--citations-only cannot be combined with --shard or --budget")
+    if args.command and (args.shard or args.budget or args.citations_only):
+        parser.error(f"--shard, --budget and --citations-only do not apply to '{args.command}'")
+
+    if args.command == "merge":
+        run_merge(args.files)
+        return
+    if args.command == "index":
+        write_author_index(sort_publications(load_existing()))
+        return
+
+    config = load_config()
+    authors_config = config.get("authors", [])
+    max_results = config.get("maxResults", 100)
+    output_format = get_output_format(config)
+
+    if not authors_config:
+        print("No authors configured in config/scholar.yml")
+        sys.exit(1)
+
+    load_scholarly()
+    setup_proxy()
+
+    if args.citations_only:
+        run_citations_refresh(authors_config, output_format)
+        return
+
+    budget = FetchBudget(*args.budget) if args.budget else FetchBudget()
+
+    if args.shard:
+        run_shard(authors_config, max_results, budget, *args.shard)
+        return
+
+    existing = load_existing()
+    state = load_sync_state()
+    all_pubs, author_success, author_fail, stamps = fetch_authors(
+        authors_config, max_results, budget, existing, state
+    )
+
+    # If ALL authors failed, exit without writing (preserve existing data)
+    if author_success == 0:
+        print(f"\nERROR: All {author_fail} author(s) failed. Preserving existing data.")
+        sys.exit(1)
+
+    merged = write_results(all_pubs, existing, output_format)
+    merge_timestamps(state["refreshed"], stamps["refreshed"])
+    merge_timestamps(state["attempted"], stamps["attempted"])
+    save_sync_state(state)
+    print_summary(author_success, len(authors_config), author_fail, len(all_pubs), merged, existing)
+
+
 if __name__ == "__main__":
     main()
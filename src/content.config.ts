@@ -1,5 +1,8 @@
+import fs from 'node:fs/promises';
+import path from 'node:path';
 import { defineCollection, z } from 'astro:content';
 import { glob, file } from 'astro/loaders';
+import type { Loader, LoaderContext } from 'astro/loaders';
 
 /** Treat empty/whitespace-only strings as absent (CMS writes '' instead of omitting). */
 const emptyToUndefined = z.string().optional()
@@ -90,8 +93,66 @@ const posts = defineCollection({
     }),
 });
 
+const PUBLICATIONS_DIR = 'src/content/publications';
+const PUBLICATIONS_DATA = 'src/data/publications.json';
+
+/**
+ * Per-paper Markdown files plus the consolidated publications.json written by
+ * sync-scholar.py (`outputFormat: json`). A Markdown file wins over a data entry
+ * with the same id; data entries resolve relative paths (e.g. images) as if they
+ * lived in the publications folder.
+ */
+function publicationsLoader(): Loader {
+  const markdown = glob({ pattern: '**/*.{md,mdx}', base: PUBLICATIONS_DIR });
+
+  let context: LoaderContext | undefined;
+
+  async function loadData({ store, parseData, generateDigest, logger }: LoaderContext) {
+    let raw = '[]';
+    try {
+      raw = await fs.readFile(path.resolve(process.cwd(), PUBLICATIONS_DATA), 'utf-8');
+    } catch {
+      // No consolidated file — Markdown only
+    }
+    const entries = JSON.parse(raw) as Array<{ id: string } & Record<string, unknown>>;
+    // Drop entries removed from the data file since the last load
+    const ids = new Set(entries.map((entry) => entry.id));
+    for (const [id, entry] of store.entries()) {
+      if (entry.filePath === PUBLICATIONS_DATA && !ids.has(id)) store.delete(id);
+    }
+    for (const { id, ...data } of entries) {
+      if (store.has(id) && store.get(id)?.filePath !== PUBLICATIONS_DATA) {
+        logger.warn(`Publication "${id}" exists as Markdown and in ${PUBLICATIONS_DATA}; using Markdown`);
+        continue;
+      }
+      // Resolve relative image paths as if the entry were a file in PUBLICATIONS_DIR
+      const parsed = await parseData({ id, data, filePath: `${PUBLICATIONS_DIR}/${id}.md` });
+      store.set({ id, data: parsed, filePath: PUBLICATIONS_DATA, digest: generateDigest(data) });
+    }
+  }
+
+  return {
+    name: 'publications-loader',
+    load: async (loaderContext) => {
+      await markdown.load(loaderContext);
+      await loadData(loaderContext);
+      // load() can run again in dev; keep a single listener bound to the latest context
+      const firstLoad = !context;
+      context = loaderContext;
+      if (!firstLoad) return;
+      loaderContext.watcher?.add(path.resolve(process.cwd(), PUBLICATIONS_DATA));
+      const reload = async (changed: string) => {
+        if (context && changed.endsWith(PUBLICATIONS_DATA)) await loadData(context);
+      };
+      loaderContext.watcher?.on('change', reload);
+      loaderContext.watcher?.on('add', reload);
+      loaderContext.watcher?.on('unlink', reload);
+    },
+  };
+}
+
 const publications = defineCollection({
-  loader: glob({ pattern: '**/*.{md,mdx}', base: 'src/content/publications' }),
+  loader: publicationsLoader(),
   schema: ({ image }) =>
     z.object({
       title: z.string(),
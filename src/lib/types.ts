@@ -311,10 +311,29 @@ export interface CvConfig {
 
 export interface CvMetadata {
   lastGenerated: string;
+  /** Content-hashed, immutable PDF URL (e.g. /cv.3f2a9c1b7d4e.pdf). */
   pdfPath: string;
+  /** Stable alias URL that always serves the latest PDF (e.g. /cv.pdf). */
+  aliasPath?: string;
   pdfSize: number;
 }
 
+export interface AuthorIndexEntry {
+  name: string;
+  /** Publication ids, newest first. */
+  publications: string[];
+  /** Normalized co-author name to number of shared publications. */
+  coauthors: Record<string, number>;
+  /** Year to number of publications. */
+  years: Record<string, number>;
+}
+
+export interface AuthorIndex {
+  authors: Record<string, AuthorIndexEntry>;
+  /** First-initial + last-name alias to the normalized names sharing it. */
+  aliases: Record<string, string[]>;
+}
+
 export type PersonRole =
   | 'pi'
   | 'postdoc'
@@ -30,6 +30,22 @@ export function slugify(text: string): string {
     .replace(/^-+|-+$/g, '');
 }
 
+/** Normalize an author name for author-index lookups (mirrors normalize_author in sync-scholar.py). */
+export function normalizeAuthorName(name: string): string {
+  return name
+    .normalize('NFKD')
+    .replace(/\p{M}/gu, '')
+    .toLowerCase()
+    .replace(/[^a-z0-9]+/g, ' ')
+    .trim();
+}
+
+/** First-initial + last-name alias of a normalized author name (mirrors author_alias in sync-scholar.py). */
+export function authorAliasKey(normalized: string): string {
+  const tokens = normalized.split(' ').filter(Boolean);
+  return tokens.length < 2 ? '' : `${tokens[0][0]} ${tokens[tokens.length - 1]}`;
+}
+
 export function getRoleName(role: string): string {
   const roleNames: Record<string, string> = {
     pi: 'Principal Investigator',